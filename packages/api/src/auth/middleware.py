@@ -2,7 +2,9 @@
 JWT Authentication middleware for Keycloak integration using python-jose
 """
 
+import asyncio
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 
 from fastapi import Depends, HTTPException, Request
@@ -84,7 +86,10 @@ class KeycloakJWTBearer:
         logger.info(f'Attempting OIDC discovery from: {discovery_url}')
 
         try:
-            response = requests.get(discovery_url, timeout=10.0)
+            # Cache misses run the blocking fetch off the event loop
+            response = await asyncio.to_thread(
+                requests.get, discovery_url, timeout=10.0
+            )
             response.raise_for_status()
 
             _oidc_config_cache = response.json()
@@ -146,7 +151,7 @@ class KeycloakJWTBearer:
         logger.info(f'Fetching JWKS from: {jwks_uri}')
 
         try:
-            response = requests.get(jwks_uri, timeout=10.0)
+            response = await asyncio.to_thread(requests.get, jwks_uri, timeout=10.0)
             response.raise_for_status()
 
             _jwks_cache = response.json()
@@ -252,17 +257,18 @@ async def lookup_user_by_email(email: str, session: AsyncSession) -> 'User | Non
 
 def create_user_context(db_user: 'User', is_dev_mode: bool = False) -> dict:
     """Create standardized user context from database user"""
+    username = db_user.email.partition('@')[0]  # Use email prefix as username
     return {
         'id': db_user.id,
         'email': db_user.email,
-        'username': db_user.email.split('@')[0],  # Use email prefix as username
+        'username': username,
         'roles': ['user', 'admin']
         if is_dev_mode
         else ['user'],  # Dev mode gets all roles
         'is_dev_mode': is_dev_mode,
         'token_claims': {
             'sub': db_user.id,
-            'preferred_username': db_user.email.split('@')[0],
+            'preferred_username': username,
             'email': db_user.email,
             'realm_access': {'roles': ['user', 'admin'] if is_dev_mode else ['user']},
         },
@@ -483,8 +489,13 @@ async def require_authentication(
     return user
 
 
+@lru_cache(maxsize=16)
 def require_role(required_role: str):
-    """Decorator to require specific role"""
+    """Decorator to require specific role
+
+    Cached so every route depending on the same role shares one dependency
+    callable, which FastAPI then resolves once per request.
+    """
 
     async def role_checker(
         user: dict = Depends(require_authentication), request: Request = None
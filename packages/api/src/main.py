@@ -2,10 +2,13 @@
 FastAPI application entry point
 """
 
+import asyncio
 from contextlib import asynccontextmanager
+import hashlib
+import json
 import logging
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from .core.config import settings
@@ -14,6 +17,7 @@ from .routes import health, websocket
 from .routes import transactions as transactions_routes
 from .routes import users as users_routes
 from .services.alert_job_queue import alert_job_queue
+from .services.background_alert_service import background_alert_service
 from .services.llm_thread_pool import llm_thread_pool
 from .services.recommendation_job_queue import recommendation_job_queue
 from .services.recommendation_scheduler import recommendation_scheduler
@@ -44,6 +48,8 @@ async def lifespan(app: FastAPI):
     yield
 
     await alert_job_queue.stop()
+    # Shutdown waits on the background loop's thread, so keep it off this loop
+    await asyncio.to_thread(background_alert_service.shutdown)
     logger.info('Alert monitoring service stopped')
 
     await recommendation_job_queue.stop()
@@ -83,7 +89,17 @@ app.include_router(alerts_routes.router, prefix='/api/alerts', tags=['alerts'])
 app.include_router(websocket.router, tags=['websocket'])
 
 
+# The root payload never changes, so serialize it and derive its ETag once
+_ROOT_BODY = json.dumps({'message': 'Welcome to spending-monitor API'}).encode()
+_ROOT_ETAG = f'"{hashlib.blake2b(_ROOT_BODY, digest_size=8).hexdigest()}"'
+_ROOT_HEADERS = {'ETag': _ROOT_ETAG, 'Cache-Control': 'public, max-age=60'}
+
+
 @app.get('/')
-async def root() -> dict[str, str]:
+async def root(request: Request) -> Response:
     """Root endpoint"""
-    return {'message': 'Welcome to spending-monitor API'}
+    if request.headers.get('if-none-match') == _ROOT_ETAG:
+        return Response(status_code=304, headers=_ROOT_HEADERS)
+    return Response(
+        content=_ROOT_BODY, media_type='application/json', headers=_ROOT_HEADERS
+    )
@@ -5,6 +5,7 @@ import uuid
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db import get_db
@@ -16,7 +17,9 @@ from ..schemas.transaction import (
     CreditCardCreate,
     CreditCardOut,
     CreditCardUpdate,
+    ImportResult,
     TransactionCreate,
+    TransactionImport,
     TransactionOut,
     TransactionSummary,
 )
@@ -27,6 +30,10 @@ from ..services.background_alert_service import background_alert_service
 router = APIRouter()
 alert_rule_service = AlertRuleService()
 
+# Rows per INSERT statement in bulk imports, keeping each statement well under
+# asyncpg's 32767 bind parameter limit (the wire protocol itself allows 65535)
+IMPORT_CHUNK_SIZE = 1000
+
 
 @router.get('/', response_model=list[TransactionOut])
 async def get_transactions(
@@ -71,7 +78,7 @@ async def get_transactions(
         try:
             from datetime import datetime
 
-            start_datetime = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+            start_datetime = datetime.fromisoformat(start_date)
             query = query.where(Transaction.transaction_date >= start_datetime)
         except ValueError as e:
             raise HTTPException(
@@ -83,7 +90,7 @@ async def get_transactions(
         try:
             from datetime import datetime
 
-            end_datetime = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+            end_datetime = datetime.fromisoformat(end_date)
             query = query.where(Transaction.transaction_date <= end_datetime)
         except ValueError as e:
             raise HTTPException(
@@ -204,9 +211,7 @@ async def create_transaction(
     from datetime import datetime
 
     try:
-        transaction_date = datetime.fromisoformat(
-            payload.transaction_date.replace('Z', '+00:00')
-        )
+        transaction_date = datetime.fromisoformat(payload.transaction_date)
     except ValueError as e:
         raise HTTPException(
             status_code=400,
@@ -282,6 +287,109 @@ async def create_transaction(
     )
 
 
+@router.post('/import', response_model=ImportResult)
+async def import_transactions(
+    payload: TransactionImport,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(require_authentication),
+):
+    """Import a batch of transactions using a single session and commit"""
+    from datetime import datetime
+
+    is_admin = 'admin' in current_user.get('roles', [])
+    errors: list[str] = []
+    rows: list[dict] = []
+    seen_ids: set[str] = set()
+
+    # Non-admin users can only import their own transactions
+    if is_admin:
+        user_ids = {item.user_id for item in payload.transactions}
+    else:
+        user_ids = {current_user['id']}
+    users_result = await session.execute(select(User.id).where(User.id.in_(user_ids)))
+    known_users = set(users_result.scalars().all())
+
+    for item in payload.transactions:
+        if item.id in seen_ids:
+            errors.append(f'Transaction {item.id}: duplicated in import')
+            continue
+        seen_ids.add(item.id)
+
+        user_id = item.user_id if is_admin else current_user['id']
+        if user_id not in known_users:
+            errors.append(f'Transaction {item.id}: user {user_id} not found')
+            continue
+
+        try:
+            transaction_date = datetime.fromisoformat(item.transaction_date)
+        except ValueError:
+            errors.append(f'Transaction {item.id}: invalid transaction date format')
+            continue
+
+        rows.append(
+            {
+                'id': item.id,
+                'user_id': user_id,
+                'credit_card_num': item.credit_card_num,
+                'amount': item.amount,
+                'currency': item.currency,
+                'description': item.description,
+                'merchant_name': item.merchant_name,
+                'merchant_category': item.merchant_category,
+                'transaction_date': transaction_date,
+                'transaction_type': item.transaction_type,
+                'merchant_longitude': item.merchant_longitude,
+                'merchant_latitude': item.merchant_latitude,
+                'merchant_city': item.merchant_city,
+                'merchant_state': item.merchant_state,
+                'merchant_country': item.merchant_country,
+                'merchant_zipcode': item.merchant_zipcode,
+                'status': item.status,
+                'authorization_code': item.authorization_code,
+                'trans_num': item.trans_num,
+            }
+        )
+
+    # Let the primary key reject already-stored IDs instead of checking first,
+    # which also closes the race between the check and the insert
+    inserted_ids: set[str] = set()
+    for start in range(0, len(rows), IMPORT_CHUNK_SIZE):
+        stmt = (
+            pg_insert(Transaction)
+            .values(rows[start : start + IMPORT_CHUNK_SIZE])
+            .on_conflict_do_nothing(index_elements=[Transaction.id])
+            .returning(Transaction.id)
+        )
+        result = await session.execute(stmt)
+        inserted_ids.update(result.scalars().all())
+    if rows:
+        await session.commit()
+
+    imported = [
+        (row['user_id'], row['id']) for row in rows if row['id'] in inserted_ids
+    ]
+    errors.extend(
+        f'Transaction {row["id"]}: already exists'
+        for row in rows
+        if row['id'] not in inserted_ids
+    )
+
+    # Hand the whole batch to the background alert loop after the response,
+    # so evaluating rules never blocks this request or the API event loop
+    if imported:
+        background_tasks.add_task(
+            background_alert_service.process_transactions_background, imported
+        )
+
+    return ImportResult(
+        totalProcessed=len(payload.transactions),
+        successful=len(imported),
+        failed=len(errors),
+        errors=errors,
+    )
+
+
 @router.delete('/{transaction_id}')
 async def delete_transaction(
     transaction_id: str,
@@ -500,7 +608,7 @@ async def get_transaction_summary(
         try:
             from datetime import datetime
 
-            start_datetime = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+            start_datetime = datetime.fromisoformat(start_date)
             query = query.where(Transaction.transaction_date >= start_datetime)
         except ValueError as e:
             raise HTTPException(
@@ -512,7 +620,7 @@ async def get_transaction_summary(
         try:
             from datetime import datetime
 
-            end_datetime = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+            end_datetime = datetime.fromisoformat(end_date)
             query = query.where(Transaction.transaction_date <= end_datetime)
         except ValueError as e:
             raise HTTPException(
@@ -568,7 +676,7 @@ async def get_category_spending(
         try:
             from datetime import datetime
 
-            start_datetime = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+            start_datetime = datetime.fromisoformat(start_date)
             query = query.where(Transaction.transaction_date >= start_datetime)
         except ValueError as e:
             raise HTTPException(
@@ -580,7 +688,7 @@ async def get_category_spending(
         try:
             from datetime import datetime
 
-            end_datetime = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+            end_datetime = datetime.fromisoformat(end_date)
             query = query.where(Transaction.transaction_date <= end_datetime)
         except ValueError as e:
             raise HTTPException(
@@ -35,28 +35,44 @@ class AlertJob:
 class AlertJobQueue:
     """Simple in-memory job queue for alert processing"""
 
-    def __init__(self):
-        self._queue: asyncio.Queue = asyncio.Queue()
+    def __init__(self, max_size: int = 2000, num_workers: int = 4):
+        # Bounded so a burst of imports applies backpressure to producers
+        # instead of growing the queue without limit
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
         self._jobs: dict[str, AlertJob] = {}
-        self._worker_task: asyncio.Task | None = None
+        # Workers overlap while a job waits on the database or on the LLM call,
+        # which AlertRuleService runs in llm_thread_pool
+        self._num_workers = num_workers
+        self._worker_tasks: list[asyncio.Task] = []
         self._is_running = False
 
     async def start(self):
-        """Start the background worker"""
+        """Start the background workers"""
         if not self._is_running:
             self._is_running = True
-            self._worker_task = asyncio.create_task(self._worker())
-            logger.info('Alert job queue worker started')
+            self._worker_tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self._num_workers)
+            ]
+            logger.info('Alert job queue started %s workers', self._num_workers)
 
-    async def stop(self):
-        """Stop the background worker"""
+    async def stop(self, drain_timeout: float = 10.0):
+        """Stop the background workers, first letting queued jobs finish"""
         if self._is_running:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+            except TimeoutError:
+                logger.warning(
+                    'Alert job queue stopped with %s jobs pending',
+                    self._queue.qsize(),
+                )
             self._is_running = False
-            if self._worker_task:
-                self._worker_task.cancel()
+            for task in self._worker_tasks:
+                task.cancel()
+            for task in self._worker_tasks:
                 with contextlib.suppress(asyncio.CancelledError):
-                    await self._worker_task
-            logger.info('Alert job queue worker stopped')
+                    await task
+            self._worker_tasks = []
+            logger.info('Alert job queue workers stopped')
 
     async def enqueue_job(
         self,
@@ -80,8 +96,11 @@ class AlertJobQueue:
         self._jobs[job_id] = job
         await self._queue.put(job)
 
-        logger.info(
-            f'Enqueued alert job {job_id} for user {user_id}, transaction {transaction_id}'
+        logger.debug(
+            'Enqueued alert job %s for user %s, transaction %s',
+            job_id,
+            user_id,
+            transaction_id,
         )
         return job_id
 
@@ -102,7 +121,7 @@ class AlertJobQueue:
                 job.status = JobStatus.PROCESSING
                 self._jobs[job.job_id] = job
 
-                logger.info(f'Processing alert job {job.job_id}')
+                logger.debug('Processing alert job %s', job.job_id)
 
                 try:
                     # Process the job
@@ -117,7 +136,7 @@ class AlertJobQueue:
                     job.result = result
                     self._jobs[job.job_id] = job
 
-                    logger.info(f'Completed alert job {job.job_id}: {result}')
+                    logger.debug('Completed alert job %s: %s', job.job_id, result)
 
                 except Exception as e:
                     # Update job with error
@@ -125,7 +144,7 @@ class AlertJobQueue:
                     job.error = str(e)
                     self._jobs[job.job_id] = job
 
-                    logger.error(f'Failed alert job {job.job_id}: {str(e)}')
+                    logger.error('Failed alert job %s: %s', job.job_id, e)
 
                 # Mark task as done
                 self._queue.task_done()
@@ -134,7 +153,7 @@ class AlertJobQueue:
                 # No job available, continue
                 continue
             except Exception as e:
-                logger.error(f'Error in alert job worker: {str(e)}')
+                logger.error('Error in alert job worker: %s', e)
                 await asyncio.sleep(1)  # Brief pause before retrying
 
 
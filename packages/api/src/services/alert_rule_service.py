@@ -14,6 +14,7 @@ from db.models import (
     Transaction,
     User,
 )
+from src.services.llm_thread_pool import llm_thread_pool
 from src.services.notification_service import NotificationService
 
 from .alerts.validate_rule_graph import app as validate_rule_graph
@@ -302,8 +303,13 @@ class AlertRuleService:
         transaction_id = transaction.id
         try:
             print('DEBUG: About to call generate_alert_with_llm')
-            alert_result = self.generate_alert_with_llm(
-                rule.natural_language_query, transaction.__dict__, user.__dict__
+            # The LLM graph call blocks, so run it off the event loop to keep
+            # concurrent rule evaluations (and other requests) moving
+            alert_result = await llm_thread_pool.run_in_thread(
+                self.generate_alert_with_llm,
+                rule.natural_language_query,
+                transaction.__dict__,
+                user.__dict__,
             )
             print(f'DEBUG: generate_alert_with_llm completed, result: {alert_result}')
 
@@ -320,13 +326,15 @@ class AlertRuleService:
                     rule.trigger_count = trigger_count + 1
                     rule.last_triggered = datetime.now(UTC)
                     session.add(rule)
+                    # Persist the notification and rule update in one commit
+                    # before delivery, so the record survives a failed or slow
+                    # send and no locks are held across the network call
                     await session.commit()
-                    await session.refresh(rule)
+                    await session.refresh(notification)
                 except Exception as e:
                     print(f'DEBUG: Error creating notification: {e}')
                     raise e
 
-                await session.refresh(notification)
                 notification = await self.send_notification(notification, session)
 
                 return {
@@ -4,15 +4,8 @@ from langchain.tools import tool
 
 from .utils import extract_sql, get_llm_client
 
-
-def build_prompt(last_transaction: dict, alert_text: str, alert_rule: dict) -> str:
-    user_id = last_transaction.get('user_id', '').strip()
-    transaction_date = last_transaction.get('transaction_date', '')
-    merchant_name = alert_rule.get('merchant_name', '').lower()
-    merchant_category = alert_rule.get('merchant_category', '').lower()
-    recurring_interval_days = alert_rule.get('recurring_interval_days', 35)
-
-    schema = """
+# Static part of the prompt, built once instead of on every call
+SCHEMA = """
 Table: transactions
 Columns:
 - id: primary key
@@ -56,6 +49,14 @@ Columns:
 - last_merchant_country    text
 """
 
+
+def build_prompt(last_transaction: dict, alert_text: str, alert_rule: dict) -> str:
+    user_id = last_transaction.get('user_id', '').strip()
+    transaction_date = last_transaction.get('transaction_date', '')
+    merchant_name = alert_rule.get('merchant_name', '').lower()
+    merchant_category = alert_rule.get('merchant_category', '').lower()
+    recurring_interval_days = alert_rule.get('recurring_interval_days', 35)
+
     prompt = f"""
 You are a SQL assistant.
 You must generate **PostgreSQL-compatible SQL** only.
@@ -242,7 +243,7 @@ last_transaction Input:
 {last_transaction}
 
 Schema:
-{schema}
+{SCHEMA}
 
 Natural language alert: "{alert_text}"
 
@@ -96,9 +96,10 @@ class TransactionService:
 
     def get_dummy_transaction(self, user_id: str) -> dict[str, Any]:
         """Get a dummy transaction for a user (for testing/fallback purposes)."""
+        now = datetime.now().isoformat()
         return {
             'user_id': user_id,
-            'transaction_date': datetime.now().isoformat(),
+            'transaction_date': now,
             'credit_card_num': '1234567890',
             'amount': 100.00,
             'currency': 'USD',
@@ -114,6 +115,6 @@ class TransactionService:
             'trans_num': 'Dummy trans_num',
             'authorization_code': 'Dummy authorization_code',
             'status': 'Dummy status',
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat(),
+            'created_at': now,
+            'updated_at': now,
         }
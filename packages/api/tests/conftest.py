@@ -3,11 +3,40 @@
 import asyncio
 from datetime import datetime
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from db.models import AlertRule, AlertType, Transaction
+from db.models import AlertType
+
+# Invariant sample data built once at import; fixtures hand out copies
+SAMPLE_TRANSACTION_DATA = {
+    'id': 'tx-123',
+    'user_id': 'user-456',
+    'amount': Decimal('150.00'),
+    'currency': 'USD',
+    'merchant_name': 'Test Store',
+    'merchant_category': 'Retail',
+    'credit_card_num': '1234567890',
+    'transaction_date': datetime(2024, 1, 15, 14, 30, 0),
+    'trans_num': 'trans-789',
+    'description': 'Test transaction',
+    'status': 'completed',
+}
+
+SAMPLE_ALERT_RULE_DATA = {
+    'id': 'rule-123',
+    'user_id': 'user-456',
+    'name': 'Large transaction alert',
+    'description': 'Alert for large transactions',
+    'natural_language_query': 'Alert me when transactions exceed $100',
+    'is_active': True,
+    'trigger_count': 5,
+    'alert_type': AlertType.AMOUNT_THRESHOLD,
+    'created_at': datetime(2024, 1, 1, 10, 0, 0),
+    'updated_at': datetime(2024, 1, 1, 10, 0, 0),
+}
 
 
 @pytest.fixture(scope='session')
@@ -39,55 +68,25 @@ def sample_user_id():
 @pytest.fixture
 def sample_transaction_data():
     """Create sample transaction data as dict"""
-    return {
-        'id': 'tx-123',
-        'user_id': 'user-456',
-        'amount': Decimal('150.00'),
-        'currency': 'USD',
-        'merchant_name': 'Test Store',
-        'merchant_category': 'Retail',
-        'credit_card_num': '1234567890',
-        'transaction_date': datetime(2024, 1, 15, 14, 30, 0),
-        'trans_num': 'trans-789',
-        'description': 'Test transaction',
-        'status': 'completed',
-    }
+    return SAMPLE_TRANSACTION_DATA.copy()
 
 
 @pytest.fixture
 def sample_transaction_obj(sample_transaction_data):
-    """Create a mock Transaction object"""
-    transaction = MagicMock(spec=Transaction)
-    for key, value in sample_transaction_data.items():
-        setattr(transaction, key, value)
-    transaction.__dict__ = sample_transaction_data.copy()
-    return transaction
+    """Create a Transaction stand-in (a plain attribute bag, no spec mocking)"""
+    return SimpleNamespace(**sample_transaction_data)
 
 
 @pytest.fixture
 def sample_alert_rule_data():
     """Create sample alert rule data"""
-    return {
-        'id': 'rule-123',
-        'user_id': 'user-456',
-        'name': 'Large transaction alert',
-        'description': 'Alert for large transactions',
-        'natural_language_query': 'Alert me when transactions exceed $100',
-        'is_active': True,
-        'trigger_count': 5,
-        'alert_type': AlertType.AMOUNT_THRESHOLD,
-        'created_at': datetime(2024, 1, 1, 10, 0, 0),
-        'updated_at': datetime(2024, 1, 1, 10, 0, 0),
-    }
+    return SAMPLE_ALERT_RULE_DATA.copy()
 
 
 @pytest.fixture
 def sample_alert_rule_obj(sample_alert_rule_data):
-    """Create a mock AlertRule object"""
-    rule = MagicMock(spec=AlertRule)
-    for key, value in sample_alert_rule_data.items():
-        setattr(rule, key, value)
-    return rule
+    """Create an AlertRule stand-in (a plain attribute bag, no spec mocking)"""
+    return SimpleNamespace(**sample_alert_rule_data)
 
 
 @pytest.fixture
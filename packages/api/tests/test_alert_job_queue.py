@@ -0,0 +1,144 @@
+"""Test cases for AlertJobQueue"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.alert_job_queue import AlertJobQueue, JobStatus
+
+PROCESS_PATH = (
+    'src.services.background_alert_service.background_alert_service'
+    '.process_alert_rules_async'
+)
+
+
+async def _wait_for_status(queue, job_id, status, timeout=5.0):
+    async def poll():
+        while queue.get_job_status(job_id).status != status:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout=timeout)
+
+
+class TestAlertJobQueue:
+    """Test suite for AlertJobQueue"""
+
+    @pytest.mark.asyncio
+    async def test_workers_process_enqueued_jobs(self):
+        """Test enqueued jobs are processed and marked completed"""
+        queue = AlertJobQueue(max_size=10, num_workers=2)
+        process = AsyncMock(return_value={'status': 'success'})
+
+        with patch(PROCESS_PATH, process):
+            await queue.start()
+            job_ids = [
+                await queue.enqueue_job(user_id='user-1', transaction_id=f'tx-{i}')
+                for i in range(3)
+            ]
+            for job_id in job_ids:
+                await _wait_for_status(queue, job_id, JobStatus.COMPLETED)
+            await queue.stop()
+
+        assert process.await_count == 3
+        for job_id in job_ids:
+            job = queue.get_job_status(job_id)
+            assert job.result == {'status': 'success'}
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_marked_failed(self):
+        """Test a job whose processing raises is marked failed with the error"""
+        queue = AlertJobQueue(max_size=10, num_workers=1)
+        process = AsyncMock(side_effect=RuntimeError('boom'))
+
+        with patch(PROCESS_PATH, process):
+            await queue.start()
+            job_id = await queue.enqueue_job(user_id='user-1', transaction_id='tx-1')
+            await _wait_for_status(queue, job_id, JobStatus.FAILED)
+            await queue.stop()
+
+        assert queue.get_job_status(job_id).error == 'boom'
+
+    @pytest.mark.asyncio
+    async def test_workers_process_jobs_concurrently(self):
+        """Test a slow job does not hold up the other workers"""
+        queue = AlertJobQueue(max_size=10, num_workers=2)
+        release = asyncio.Event()
+        started = []
+
+        async def process(**kwargs):
+            started.append(kwargs['transaction_id'])
+            await release.wait()
+            return {'status': 'success'}
+
+        with patch(PROCESS_PATH, AsyncMock(side_effect=process)):
+            await queue.start()
+            job_ids = [
+                await queue.enqueue_job(user_id='user-1', transaction_id=f'tx-{i}')
+                for i in range(2)
+            ]
+            for job_id in job_ids:
+                await _wait_for_status(queue, job_id, JobStatus.PROCESSING)
+
+            assert sorted(started) == ['tx-0', 'tx-1']
+            release.set()
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_blocks_when_queue_is_full(self):
+        """Test producers wait for room once the queue is full"""
+        queue = AlertJobQueue(max_size=1, num_workers=1)
+        process = AsyncMock(return_value={'status': 'success'})
+
+        with patch(PROCESS_PATH, process):
+            await queue.enqueue_job(user_id='user-1', transaction_id='tx-0')
+            blocked = asyncio.create_task(
+                queue.enqueue_job(user_id='user-1', transaction_id='tx-1')
+            )
+            await asyncio.sleep(0.05)
+            assert not blocked.done()
+
+            # Starting a worker frees a slot and lets the producer through
+            await queue.start()
+            job_id = await asyncio.wait_for(blocked, timeout=5.0)
+            await _wait_for_status(queue, job_id, JobStatus.COMPLETED)
+            await queue.stop()
+
+        assert process.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_queued_jobs(self):
+        """Test stop lets queued jobs finish before the workers exit"""
+        queue = AlertJobQueue(max_size=10, num_workers=1)
+
+        async def process(**kwargs):
+            await asyncio.sleep(0.01)
+            return {'status': 'success'}
+
+        with patch(PROCESS_PATH, AsyncMock(side_effect=process)):
+            await queue.start()
+            job_ids = [
+                await queue.enqueue_job(user_id='user-1', transaction_id=f'tx-{i}')
+                for i in range(5)
+            ]
+            await queue.stop()
+
+        for job_id in job_ids:
+            assert queue.get_job_status(job_id).status == JobStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_stop_gives_up_on_jobs_past_drain_timeout(self):
+        """Test stop returns after the drain timeout even if a job hangs"""
+        queue = AlertJobQueue(max_size=10, num_workers=1)
+        never = asyncio.Event()
+
+        async def process(**kwargs):
+            await never.wait()
+
+        with patch(PROCESS_PATH, AsyncMock(side_effect=process)):
+            await queue.start()
+            job_id = await queue.enqueue_job(user_id='user-1', transaction_id='tx-1')
+            await _wait_for_status(queue, job_id, JobStatus.PROCESSING)
+            await asyncio.wait_for(queue.stop(drain_timeout=0.05), timeout=5.0)
+
+        assert queue.get_job_status(job_id).status == JobStatus.PROCESSING
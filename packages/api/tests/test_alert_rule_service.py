@@ -2,11 +2,12 @@
 
 from datetime import datetime
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import pytest
 
-from db.models import AlertRule, AlertType, Transaction, User
+from db.models import AlertType
 from src.services.alert_rule_service import AlertRuleService
 
 
@@ -32,6 +33,26 @@ def mock_llm_services():
         yield {'parse_graph': mock_parse_graph, 'generate_graph': mock_generate_graph}
 
 
+@pytest.fixture(scope='module')
+def session_mock():
+    """Build the mock database session graph once per module"""
+    session = AsyncMock()
+    # session.add should be synchronous, not async
+    session.add = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.refresh = AsyncMock()
+
+    # Configure the execute result to avoid AsyncMock warnings
+    mock_result = MagicMock()
+    mock_scalars = MagicMock()
+    mock_scalars.all.return_value = []  # Empty list for existing rules
+    mock_result.scalars.return_value = mock_scalars
+    session.execute.return_value = mock_result
+
+    return session
+
+
 class TestAlertRuleService:
     """Test suite for AlertRuleService"""
 
@@ -50,82 +71,59 @@ class TestAlertRuleService:
         return service
 
     @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session"""
-        session = AsyncMock()
-        # session.add should be synchronous, not async
-        session.add = MagicMock()
-        session.execute = AsyncMock()
-        session.commit = AsyncMock()
-        session.refresh = AsyncMock()
-
-        # Configure the execute result to avoid AsyncMock warnings
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []  # Empty list for existing rules
-        mock_result.scalars.return_value = mock_scalars
-        session.execute.return_value = mock_result
-
-        return session
+    def mock_session(self, session_mock):
+        """Provide the shared mock session with calls and side effects cleared"""
+        session_mock.reset_mock(side_effect=True)
+        return session_mock
 
     @pytest.fixture
     def sample_transaction_obj(self):
         """Create a sample transaction object"""
-        transaction = MagicMock(spec=Transaction)
-        transaction.id = 'tx-123'
-        transaction.user_id = 'user-456'
-        transaction.amount = Decimal('150.00')
-        transaction.currency = 'USD'
-        transaction.merchant_name = 'Test Store'
-        transaction.merchant_category = 'Retail'
-        transaction.transaction_date = datetime(2024, 1, 15, 14, 30, 0)
-        transaction.trans_num = 'trans-789'
-        transaction.__dict__ = {
-            'id': transaction.id,
-            'user_id': transaction.user_id,
-            'amount': transaction.amount,
-            'currency': transaction.currency,
-            'merchant_name': transaction.merchant_name,
-            'merchant_category': transaction.merchant_category,
-            'transaction_date': transaction.transaction_date,
-            'trans_num': transaction.trans_num,
-        }
-        return transaction
+        return SimpleNamespace(
+            id='tx-123',
+            user_id='user-456',
+            amount=Decimal('150.00'),
+            currency='USD',
+            merchant_name='Test Store',
+            merchant_category='Retail',
+            transaction_date=datetime(2024, 1, 15, 14, 30, 0),
+            trans_num='trans-789',
+        )
 
     @pytest.fixture
     def sample_alert_rule(self):
         """Create a sample alert rule object"""
-        rule = MagicMock(spec=AlertRule)
-        rule.id = 'rule-123'
-        rule.user_id = 'user-456'
-        rule.name = 'Large transaction alert'
-        rule.natural_language_query = 'Alert me when transactions exceed $100'
-        rule.is_active = True
-        rule.trigger_count = 5
-        rule.alert_type = AlertType.AMOUNT_THRESHOLD
-        return rule
+        return SimpleNamespace(
+            id='rule-123',
+            user_id='user-456',
+            name='Large transaction alert',
+            natural_language_query='Alert me when transactions exceed $100',
+            is_active=True,
+            trigger_count=5,
+            alert_type=AlertType.AMOUNT_THRESHOLD,
+        )
 
     @pytest.fixture
     def sample_user_obj(self):
         """Create a sample user object"""
-        user = MagicMock(spec=User)
-        user.id = 'user-456'
-        user.email = 'test@example.com'
-        user.first_name = 'John'
-        user.last_name = 'Doe'
-        return user
+        return SimpleNamespace(
+            id='user-456',
+            email='test@example.com',
+            first_name='John',
+            last_name='Doe',
+        )
 
     @pytest.fixture
     def inactive_alert_rule(self):
         """Create an inactive alert rule object"""
-        rule = MagicMock(spec=AlertRule)
-        rule.id = 'rule-456'
-        rule.user_id = 'user-456'
-        rule.name = 'Inactive alert'
-        rule.natural_language_query = 'Alert me for dining expenses'
-        rule.is_active = False
-        rule.trigger_count = 0
-        return rule
+        return SimpleNamespace(
+            id='rule-456',
+            user_id='user-456',
+            name='Inactive alert',
+            natural_language_query='Alert me for dining expenses',
+            is_active=False,
+            trigger_count=0,
+        )
 
     @pytest.mark.asyncio
     async def test_validate_alert_rule_success_with_real_transaction(
@@ -302,6 +300,11 @@ class TestAlertRuleService:
     ):
         """Test successful triggering of an alert rule"""
         # Arrange
+        calls = []
+        mock_session.commit.side_effect = lambda: calls.append('commit')
+        alert_rule_service.notification_service.notify.side_effect = (
+            lambda *args, **kwargs: calls.append('notify') or DEFAULT
+        )
         with patch.object(
             alert_rule_service, 'generate_alert_with_llm'
         ) as mock_generate:
@@ -321,6 +324,8 @@ class TestAlertRuleService:
             assert result['transaction_id'] == sample_transaction_obj.id
             assert 'notification_id' in result
             assert 'rule_evaluation' in result
+            # The notification is committed before delivery, then its status
+            assert calls == ['commit', 'notify', 'commit']
 
     @pytest.mark.asyncio
     async def test_trigger_alert_rule_not_triggered(
@@ -189,6 +189,11 @@ class TestRoleBasedAuth:
 
         assert exc_info.value.status_code == 403
 
+    def test_require_role_returns_shared_dependency(self):
+        """Test the same role reuses one dependency callable"""
+        assert require_role('admin') is require_role('admin')
+        assert require_role('admin') is not require_role('user')
+
     @pytest.mark.asyncio
     async def test_require_any_role_success(self):
         """Test successful any-role requirement"""
@@ -212,11 +217,10 @@ class TestRoleBasedAuth:
 
 
 @pytest.fixture(autouse=True)
-def reset_caches():
-    """Reset global caches before each test"""
+def reset_caches(monkeypatch):
+    """Reset global caches for each test and restore them afterwards"""
     import src.auth.middleware
 
-    src.auth.middleware._oidc_config_cache = None
-    src.auth.middleware._jwks_cache = None
-    src.auth.middleware._cache_expiry = None
-    yield
+    monkeypatch.setattr(src.auth.middleware, '_oidc_config_cache', None)
+    monkeypatch.setattr(src.auth.middleware, '_jwks_cache', None)
+    monkeypatch.setattr(src.auth.middleware, '_cache_expiry', None)
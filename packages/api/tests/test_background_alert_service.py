@@ -0,0 +1,147 @@
+"""Test cases for BackgroundAlertService dispatch onto its background loop"""
+
+import logging
+import threading
+import time
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.background_alert_service import BackgroundAlertService
+
+
+def _loop_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == 'background-alert-loop']
+
+
+@pytest.fixture
+def engine():
+    """Async engine stand-in so no database is needed"""
+    engine = MagicMock()
+    engine.dispose = AsyncMock()
+    return engine
+
+
+@pytest.fixture
+def create_engine(engine):
+    """Patch engine creation for the background loop"""
+    with patch(
+        'src.services.background_alert_service.create_async_engine',
+        return_value=engine,
+    ) as create_engine:
+        yield create_engine
+
+
+@pytest.fixture
+def service(create_engine):
+    """BackgroundAlertService whose background engine is mocked"""
+    service = BackgroundAlertService()
+    yield service
+    service.shutdown()
+
+
+class TestBackgroundAlertService:
+    """Test suite for BackgroundAlertService"""
+
+    def test_dispatch_runs_processing_on_background_loop(self, service):
+        """Test background dispatch evaluates the rules off the caller's thread"""
+        done = threading.Event()
+        threads = []
+
+        async def process(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            done.set()
+            return {'status': 'success'}
+
+        with patch.object(
+            service, 'process_alert_rules_async', AsyncMock(side_effect=process)
+        ) as process_mock:
+            service.process_alert_rules_background('user-1', 'tx-1')
+            assert done.wait(timeout=5.0)
+
+        process_mock.assert_awaited_once_with('user-1', 'tx-1', None, session=ANY)
+        assert threads == ['background-alert-loop']
+
+    def test_dispatch_failure_is_logged(self, service, caplog):
+        """Test an exception from background processing is logged, not lost"""
+        with (
+            caplog.at_level(logging.ERROR),
+            patch.object(
+                service,
+                'process_alert_rules_async',
+                AsyncMock(side_effect=RuntimeError('boom')),
+            ),
+        ):
+            service.process_alert_rules_background('user-1', 'tx-1')
+
+            deadline = time.monotonic() + 5.0
+            while not caplog.records and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert len(caplog.records) == 1
+        record = caplog.records[0]
+        assert 'Background alert processing failed: boom' in record.getMessage()
+        assert record.exc_info is not None
+
+    def test_shutdown_disposes_engine_and_stops_loop(self, service, engine):
+        """Test shutdown disposes the engine and stops the loop thread"""
+        done = threading.Event()
+
+        async def process(*args, **kwargs):
+            done.set()
+            return {'status': 'success'}
+
+        with patch.object(
+            service, 'process_alert_rules_async', AsyncMock(side_effect=process)
+        ):
+            service.process_alert_rules_background('user-1', 'tx-1')
+            assert done.wait(timeout=5.0)
+            assert len(_loop_threads()) == 1
+
+            service.shutdown()
+
+        engine.dispose.assert_awaited_once()
+        assert _loop_threads() == []
+
+    def test_dispatch_after_shutdown_is_dropped(self, service, create_engine, caplog):
+        """Test work arriving after shutdown neither runs nor restarts the loop"""
+        service.shutdown()
+
+        with (
+            caplog.at_level(logging.WARNING),
+            patch.object(service, 'process_alert_rules_async', AsyncMock()) as process,
+        ):
+            service.process_alert_rules_background('user-1', 'tx-1')
+            service.process_transactions_background([('user-1', 'tx-2')])
+
+        process.assert_not_called()
+        create_engine.assert_not_called()
+        assert _loop_threads() == []
+        assert len(caplog.records) == 2
+
+    def test_shutdown_without_dispatch_is_noop(self, service, create_engine):
+        """Test shutdown before any background work does nothing"""
+        service.shutdown()
+
+        create_engine.assert_not_called()
+        assert _loop_threads() == []
+
+    def test_batch_dispatch_processes_every_transaction(self, service):
+        """Test a batch hand-off evaluates each transaction on the background loop"""
+        transactions = [('user-1', f'tx-{i}') for i in range(10)]
+        seen = []
+        done = threading.Event()
+
+        async def process(user_id, transaction_id, alert_rule_ids=None, session=None):
+            seen.append((user_id, transaction_id))
+            if len(seen) == len(transactions):
+                done.set()
+            return {'status': 'success'}
+
+        with patch.object(
+            service, 'process_alert_rules_async', AsyncMock(side_effect=process)
+        ):
+            service.process_transactions_background(transactions)
+            assert done.wait(timeout=5.0)
+
+        assert sorted(seen) == sorted(transactions)
@@ -0,0 +1,204 @@
+"""Test cases for the bulk transaction import endpoint"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import BackgroundTasks
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Insert
+
+from src.routes.transactions import IMPORT_CHUNK_SIZE, import_transactions
+from src.schemas.transaction import TransactionImport
+from src.services.background_alert_service import background_alert_service
+
+ADMIN = {'id': 'admin-1', 'roles': ['admin']}
+USER = {'id': 'user-1', 'roles': ['user']}
+
+
+def _item(tx_id, user_id='user-1', **overrides):
+    item = {
+        'id': tx_id,
+        'user_id': user_id,
+        'credit_card_num': '4111',
+        'amount': 25.0,
+        'description': 'Coffee',
+        'merchant_name': 'Cafe',
+        'merchant_category': 'food',
+        'transaction_date': '2024-01-16T14:45:00+00:00',
+    }
+    item.update(overrides)
+    return item
+
+
+def _payload(items):
+    return TransactionImport(
+        transactions=items, source='api', importDate='2024-01-16T15:00:00+00:00'
+    )
+
+
+def _result(values):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(values)
+    return result
+
+
+def _inserted_ids(stmt):
+    """Transaction IDs carried by a multi-row INSERT statement"""
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    return [value for key, value in params.items() if key.startswith('id_m')]
+
+
+def _session(known_users, existing_ids=()):
+    """Session whose INSERTs skip existing_ids like ON CONFLICT DO NOTHING"""
+    session = AsyncMock(spec=AsyncSession)
+    session.inserts = []
+
+    async def execute(stmt, *args, **kwargs):
+        if isinstance(stmt, Insert):
+            ids = _inserted_ids(stmt)
+            session.inserts.append(ids)
+            return _result(i for i in ids if i not in existing_ids)
+        return _result(known_users)
+
+    session.execute.side_effect = execute
+    return session
+
+
+def _handed_off(background_tasks):
+    """(user_id, transaction_id) pairs handed to the background alert service"""
+    assert len(background_tasks.tasks) == 1
+    task = background_tasks.tasks[0]
+    assert task.func == background_alert_service.process_transactions_background
+    return task.args[0]
+
+
+class TestImportTransactions:
+    """Test suite for import_transactions"""
+
+    @pytest.mark.asyncio
+    async def test_import_inserts_and_hands_off_alerts_once(self):
+        """Test imported rows are committed and alerts handed off as one batch"""
+        session = _session(known_users=['user-1'])
+        background_tasks = BackgroundTasks()
+
+        result = await import_transactions(
+            _payload([_item('tx-1'), _item('tx-2')]), background_tasks, session, USER
+        )
+
+        assert result.successful == 2
+        assert result.failed == 0
+        session.commit.assert_awaited_once()
+        assert _handed_off(background_tasks) == [
+            ('user-1', 'tx-1'),
+            ('user-1', 'tx-2'),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_are_reported(self):
+        """Test IDs repeated in the payload or already stored are not imported"""
+        session = _session(known_users=['user-1'], existing_ids={'tx-stored'})
+        background_tasks = BackgroundTasks()
+
+        result = await import_transactions(
+            _payload([_item('tx-1'), _item('tx-1'), _item('tx-stored')]),
+            background_tasks,
+            session,
+            USER,
+        )
+
+        assert result.totalProcessed == 3
+        assert result.successful == 1
+        assert result.errors == [
+            'Transaction tx-1: duplicated in import',
+            'Transaction tx-stored: already exists',
+        ]
+        assert session.inserts == [['tx-1', 'tx-stored']]
+        assert _handed_off(background_tasks) == [('user-1', 'tx-1')]
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_is_rejected(self):
+        """Test rows for users that do not exist are not inserted"""
+        session = _session(known_users=['user-1'])
+        background_tasks = BackgroundTasks()
+
+        result = await import_transactions(
+            _payload([_item('tx-1'), _item('tx-2', user_id='ghost')]),
+            background_tasks,
+            session,
+            ADMIN,
+        )
+
+        assert result.successful == 1
+        assert result.errors == ['Transaction tx-2: user ghost not found']
+        assert session.inserts == [['tx-1']]
+
+    @pytest.mark.asyncio
+    async def test_card_number_is_not_validated(self):
+        """Test an unknown card is stored as given, like a single create"""
+        session = _session(known_users=['user-1'])
+        background_tasks = BackgroundTasks()
+
+        result = await import_transactions(
+            _payload([_item('tx-1', credit_card_num='unknown-card')]),
+            background_tasks,
+            session,
+            USER,
+        )
+
+        assert result.successful == 1
+        assert result.errors == []
+
+    @pytest.mark.asyncio
+    async def test_nothing_imported_skips_commit_and_hand_off(self):
+        """Test an import with no valid rows neither commits nor schedules work"""
+        session = _session(known_users=[])
+        background_tasks = BackgroundTasks()
+
+        result = await import_transactions(
+            _payload([_item('tx-1')]), background_tasks, session, USER
+        )
+
+        assert result.successful == 0
+        assert result.failed == 1
+        session.commit.assert_not_awaited()
+        assert background_tasks.tasks == []
+
+    @pytest.mark.asyncio
+    async def test_non_admin_cannot_import_for_other_users(self):
+        """Test a non-admin's rows are always imported as the caller"""
+        session = _session(known_users=['user-1'])
+        background_tasks = BackgroundTasks()
+
+        result = await import_transactions(
+            _payload([_item('tx-1', user_id='someone-else')]),
+            background_tasks,
+            session,
+            USER,
+        )
+
+        assert result.successful == 1
+        assert _handed_off(background_tasks) == [('user-1', 'tx-1')]
+
+    @pytest.mark.asyncio
+    async def test_large_import_is_inserted_in_chunks(self):
+        """Test imports above IMPORT_CHUNK_SIZE are split across statements"""
+        total = IMPORT_CHUNK_SIZE * 2 + 1
+        session = _session(known_users=['user-1'])
+        background_tasks = BackgroundTasks()
+
+        result = await import_transactions(
+            _payload([_item(f'tx-{i}') for i in range(total)]),
+            background_tasks,
+            session,
+            USER,
+        )
+
+        assert result.successful == total
+        assert [len(ids) for ids in session.inserts] == [
+            IMPORT_CHUNK_SIZE,
+            IMPORT_CHUNK_SIZE,
+            1,
+        ]
+        session.commit.assert_awaited_once()
+        assert len(_handed_off(background_tasks)) == total
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
+from sqlalchemy.engine import Result
 
 from db.models import Transaction
 from src.services.transaction_service import TransactionService
@@ -20,10 +21,16 @@ class TestTransactionService:
 
     @pytest.fixture
     def mock_session(self):
-        """Create a mock database session"""
+        """Create a mock database session whose execute returns a spec'd result"""
         session = AsyncMock()
+        session.execute.return_value = Mock(spec=Result)
         return session
 
+    @pytest.fixture
+    def mock_result(self, mock_session):
+        """The result returned by mock_session.execute"""
+        return mock_session.execute.return_value
+
     @pytest.fixture
     def sample_transaction(self):
         """Create a sample transaction object"""
@@ -63,7 +70,7 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_latest_transaction_success(
-        self, transaction_service, mock_session, sample_transaction
+        self, transaction_service, mock_session, sample_transaction, mock_result
     ):
         """Test successfully getting the latest transaction for a user"""
         # Arrange - Create a simple transaction object instead of using the MagicMock fixture
@@ -78,9 +85,7 @@ class TestTransactionService:
             trans_num='trans-789',
         )
 
-        mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = simple_transaction
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.get_latest_transaction(
@@ -94,13 +99,11 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_latest_transaction_not_found(
-        self, transaction_service, mock_session
+        self, transaction_service, mock_session, mock_result
     ):
         """Test getting latest transaction when user has no transactions"""
         # Arrange
-        mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.get_latest_transaction(
@@ -114,13 +117,11 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_user_transactions_success(
-        self, transaction_service, mock_session, multiple_transactions
+        self, transaction_service, mock_session, multiple_transactions, mock_result
     ):
         """Test successfully getting user transactions with pagination"""
         # Arrange
-        mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = multiple_transactions[:3]
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.get_user_transactions(
@@ -134,13 +135,11 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_user_transactions_empty_result(
-        self, transaction_service, mock_session
+        self, transaction_service, mock_session, mock_result
     ):
         """Test getting user transactions when user has no transactions"""
         # Arrange
-        mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = []
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.get_user_transactions(
@@ -153,13 +152,11 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_transactions_with_filters_all_filters(
-        self, transaction_service, mock_session, multiple_transactions
+        self, transaction_service, mock_session, multiple_transactions, mock_result
     ):
         """Test getting transactions with all filters applied"""
         # Arrange
-        mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = multiple_transactions[:2]
-        mock_session.execute.return_value = mock_result
 
         start_date = datetime(2024, 1, 1)
         end_date = datetime(2024, 1, 31)
@@ -184,13 +181,11 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_transactions_with_filters_no_filters(
-        self, transaction_service, mock_session, multiple_transactions
+        self, transaction_service, mock_session, multiple_transactions, mock_result
     ):
         """Test getting transactions with no filters (all transactions)"""
         # Arrange
-        mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = multiple_transactions
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.get_transactions_with_filters(mock_session)
@@ -201,7 +196,7 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_transaction_by_id_success(
-        self, transaction_service, mock_session, sample_transaction
+        self, transaction_service, mock_session, sample_transaction, mock_result
     ):
         """Test successfully getting a transaction by ID"""
         # Arrange - Create a simple transaction object instead of using the MagicMock fixture
@@ -216,9 +211,7 @@ class TestTransactionService:
             trans_num='trans-789',
         )
 
-        mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = simple_transaction
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.get_transaction_by_id('tx-123', mock_session)
@@ -229,13 +222,11 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_transaction_by_id_not_found(
-        self, transaction_service, mock_session
+        self, transaction_service, mock_session, mock_result
     ):
         """Test getting transaction by ID when transaction doesn't exist"""
         # Arrange
-        mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.get_transaction_by_id(
@@ -248,7 +239,7 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_user_has_transactions_true(
-        self, transaction_service, mock_session, sample_transaction
+        self, transaction_service, mock_session, sample_transaction, mock_result
     ):
         """Test user_has_transactions returns True when user has transactions"""
         # Arrange - Create a simple transaction object instead of using the MagicMock fixture
@@ -263,9 +254,7 @@ class TestTransactionService:
             trans_num='trans-789',
         )
 
-        mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = simple_transaction
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.user_has_transactions(
@@ -277,12 +266,12 @@ class TestTransactionService:
         mock_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_user_has_transactions_false(self, transaction_service, mock_session):
+    async def test_user_has_transactions_false(
+        self, transaction_service, mock_session, mock_result
+    ):
         """Test user_has_transactions returns False when user has no transactions"""
         # Arrange
-        mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.user_has_transactions(
@@ -311,13 +300,11 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_user_transactions_with_pagination(
-        self, transaction_service, mock_session, multiple_transactions
+        self, transaction_service, mock_session, multiple_transactions, mock_result
     ):
         """Test getting user transactions with different pagination parameters"""
         # Arrange
-        mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = multiple_transactions[2:4]
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.get_user_transactions(
@@ -330,13 +317,11 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_transactions_with_amount_filters_only(
-        self, transaction_service, mock_session, multiple_transactions
+        self, transaction_service, mock_session, multiple_transactions, mock_result
     ):
         """Test getting transactions with only amount filters"""
         # Arrange
-        mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = multiple_transactions[1:3]
-        mock_session.execute.return_value = mock_result
 
         # Act
         result = await transaction_service.get_transactions_with_filters(
@@ -349,13 +334,11 @@ class TestTransactionService:
 
     @pytest.mark.asyncio
     async def test_get_transactions_with_date_filters_only(
-        self, transaction_service, mock_session, multiple_transactions
+        self, transaction_service, mock_session, multiple_transactions, mock_result
     ):
         """Test getting transactions with only date filters"""
         # Arrange
-        mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = multiple_transactions[0:2]
-        mock_session.execute.return_value = mock_result
 
         start_date = datetime(2024, 1, 15)
         end_date = datetime(2024, 1, 17)
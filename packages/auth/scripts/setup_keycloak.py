@@ -5,10 +5,12 @@ Create a new Keycloak realm for spending-monitor with OIDC discovery enabled
 
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 
 
 class KeycloakRealmCreator:
@@ -20,6 +22,13 @@ class KeycloakRealmCreator:
         self.app_realm = 'spending-monitor'
         self.client_id = 'spending-monitor'
         self.access_token: str | None = None
+        # Realm role representations by name, fetched once for all test users
+        self.realm_roles: dict[str, dict] = {}
+        # One keep-alive session for every admin API call instead of a new
+        # connection per request
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
     def log(self, message: str, level: str = 'INFO'):
         """Print formatted log message"""
@@ -37,7 +46,7 @@ class KeycloakRealmCreator:
                 'client_id': 'admin-cli',
             }
 
-            response = requests.post(url, data=data, timeout=10)
+            response = self.session.post(url, data=data, timeout=10)
             response.raise_for_status()
 
             token_data = response.json()
@@ -63,7 +72,9 @@ class KeycloakRealmCreator:
                 # Don't set frontendUrl - let Keycloak use its actual URL
             }
 
-            response = requests.post(url, json=realm_data, headers=headers, timeout=10)
+            response = self.session.post(
+                url, json=realm_data, headers=headers, timeout=10
+            )
 
             if response.status_code == 201:
                 self.log(f"✅ Realm '{self.app_realm}' created successfully")
@@ -86,7 +97,7 @@ class KeycloakRealmCreator:
 
             # Check if client already exists
             clients_url = f'{self.base_url}/admin/realms/{self.app_realm}/clients'
-            response = requests.get(clients_url, headers=headers, timeout=10)
+            response = self.session.get(clients_url, headers=headers, timeout=10)
 
             if response.status_code != 200:
                 self.log(f'❌ Failed to get clients: {response.status_code}')
@@ -125,7 +136,7 @@ class KeycloakRealmCreator:
                 # Merge with existing data to preserve other settings
                 update_data = {**existing_client, **client_data}
 
-                response = requests.put(
+                response = self.session.put(
                     update_url, json=update_data, headers=headers, timeout=10
                 )
 
@@ -141,7 +152,7 @@ class KeycloakRealmCreator:
                     return False
             else:
                 # Create new client
-                response = requests.post(
+                response = self.session.post(
                     clients_url, json=client_data, headers=headers, timeout=10
                 )
 
@@ -173,7 +184,7 @@ class KeycloakRealmCreator:
                     'description': f'{role_name.title()} role for spending-monitor',
                 }
 
-                response = requests.post(
+                response = self.session.post(
                     url, json=role_data, headers=headers, timeout=10
                 )
 
@@ -193,6 +204,21 @@ class KeycloakRealmCreator:
             self.log(f'❌ Error creating roles: {e}', 'ERROR')
             return False
 
+    def load_realm_roles(self) -> bool:
+        """Fetch every realm role once so user role assignment can reuse them"""
+        try:
+            headers = {'Authorization': f'Bearer {self.access_token}'}
+            url = f'{self.base_url}/admin/realms/{self.app_realm}/roles'
+            response = self.session.get(url, headers=headers, timeout=10)
+            response.raise_for_status()
+
+            self.realm_roles = {role['name']: role for role in response.json()}
+            return True
+
+        except Exception as e:
+            self.log(f'❌ Error loading realm roles: {e}', 'ERROR')
+            return False
+
     def create_test_user(
         self,
         username: str,
@@ -209,12 +235,12 @@ class KeycloakRealmCreator:
             # Check if user already exists
             users_url = f'{self.base_url}/admin/realms/{self.app_realm}/users'
             check_url = f'{users_url}?username={username}'
-            response = requests.get(check_url, headers=headers, timeout=10)
+            response = self.session.get(check_url, headers=headers, timeout=10)
 
             user_id = None
-            if response.status_code == 200 and len(response.json()) > 0:
-                existing_user = response.json()[0]
-                user_id = existing_user['id']
+            existing_users = response.json() if response.status_code == 200 else []
+            if existing_users:
+                user_id = existing_users[0]['id']
                 self.log(f"ℹ️  User '{username}' already exists")
             else:
                 # Create new user
@@ -230,7 +256,7 @@ class KeycloakRealmCreator:
                     ],
                 }
 
-                response = requests.post(
+                response = self.session.post(
                     users_url, json=user_data, headers=headers, timeout=10
                 )
 
@@ -239,9 +265,12 @@ class KeycloakRealmCreator:
                     self.log(f"✅ User '{username}' created successfully")
                 elif response.status_code == 409:
                     # User exists, get the user ID
-                    response = requests.get(check_url, headers=headers, timeout=10)
-                    if response.status_code == 200 and len(response.json()) > 0:
-                        user_id = response.json()[0]['id']
+                    response = self.session.get(check_url, headers=headers, timeout=10)
+                    existing_users = (
+                        response.json() if response.status_code == 200 else []
+                    )
+                    if existing_users:
+                        user_id = existing_users[0]['id']
                         self.log(f"ℹ️  User '{username}' already exists")
                     else:
                         self.log('❌ Failed to get existing user ID')
@@ -253,16 +282,12 @@ class KeycloakRealmCreator:
             # Verify/assign roles if we have a user ID
             if user_id:
                 for role_name in roles:
-                    # Get role data
-                    role_url = f'{self.base_url}/admin/realms/{self.app_realm}/roles/{role_name}'
-                    role_response = requests.get(role_url, headers=headers, timeout=10)
-
-                    if role_response.status_code == 200:
-                        role_data = role_response.json()
+                    role_data = self.realm_roles.get(role_name)
 
+                    if role_data is not None:
                         # Check if role is already assigned
                         user_roles_url = f'{self.base_url}/admin/realms/{self.app_realm}/users/{user_id}/role-mappings/realm'
-                        user_roles_response = requests.get(
+                        user_roles_response = self.session.get(
                             user_roles_url, headers=headers, timeout=10
                         )
 
@@ -273,7 +298,7 @@ class KeycloakRealmCreator:
 
                         if not has_role:
                             # Assign role to user
-                            assign_response = requests.post(
+                            assign_response = self.session.post(
                                 user_roles_url,
                                 json=[role_data],
                                 headers=headers,
@@ -305,7 +330,7 @@ class KeycloakRealmCreator:
         """Test if OIDC configuration is accessible in the new realm"""
         try:
             url = f'{self.base_url}/realms/{self.app_realm}/.well-known/openid-configuration'
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
 
             if response.status_code == 200:
                 config = response.json()
@@ -383,20 +408,30 @@ class KeycloakRealmCreator:
                 },
             ]
 
-        for user_data in test_users:
-            # Extract only the fields needed for Keycloak (ignore database-specific fields)
-            keycloak_user_data = {
-                'username': user_data['username'],
-                'email': user_data['email'],
-                'password': user_data['password'],
-                'roles': user_data['roles'],
-                'first_name': user_data.get('first_name', ''),
-                'last_name': user_data.get('last_name', ''),
-            }
-            if not self.create_test_user(**keycloak_user_data):
-                self.log(
-                    f'⚠️  Failed to create user {user_data["username"]}, continuing...'
-                )
+        if not self.load_realm_roles():
+            return False
+
+        # Users are independent, so overlap their admin API round-trips
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {}
+            for user_data in test_users:
+                # Extract only the fields needed for Keycloak (ignore database-specific fields)
+                keycloak_user_data = {
+                    'username': user_data['username'],
+                    'email': user_data['email'],
+                    'password': user_data['password'],
+                    'roles': user_data['roles'],
+                    'first_name': user_data.get('first_name', ''),
+                    'last_name': user_data.get('last_name', ''),
+                }
+                future = executor.submit(self.create_test_user, **keycloak_user_data)
+                futures[future] = user_data['username']
+
+            for future in as_completed(futures):
+                if not future.result():
+                    self.log(
+                        f'⚠️  Failed to create user {futures[future]}, continuing...'
+                    )
 
         # Step 6: Test OIDC configuration
         self.log('⏳ Waiting a moment for changes to take effect...')
@@ -436,6 +471,8 @@ def main():
     except Exception as e:
         print(f'\n❌ Unexpected error: {e}')
         return 1
+    finally:
+        creator.session.close()
 
 
 if __name__ == '__main__':
@@ -3,11 +3,17 @@
 Sync database users to Keycloak realm
 """
 
+import logging
 import os
-import time
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlencode
 
 import psycopg2
 import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
 
 
 class DatabaseUserSyncer:
@@ -17,8 +23,27 @@ class DatabaseUserSyncer:
         self.admin_password = os.getenv('KEYCLOAK_ADMIN_PASSWORD', 'admin')
         self.master_realm = 'master'
         self.app_realm = os.getenv('KEYCLOAK_REALM', 'spending-monitor')
+        # Endpoint URLs only depend on configuration, so build them once
+        self.token_url = (
+            f'{self.base_url}/realms/{self.master_realm}/protocol/openid-connect/token'
+        )
+        self.users_url = f'{self.base_url}/admin/realms/{self.app_realm}/users'
         self.access_token: str | None = None
         self.default_password = os.getenv('KEYCLOAK_DEFAULT_PASSWORD', 'password123')
+        # The admin credentials are fixed, so form-encode the token request once
+        self.admin_token_body = urlencode(
+            {
+                'username': self.admin_username,
+                'password': self.admin_password,
+                'grant_type': 'password',
+                'client_id': 'admin-cli',
+            }
+        ).encode()
+        # One keep-alive session for every admin API call instead of a new
+        # connection per request
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
         # Database connection - parse from DATABASE_URL if available
         database_url = os.getenv('DATABASE_URL', '')
@@ -60,26 +85,24 @@ class DatabaseUserSyncer:
             }
 
     def log(self, message: str, level: str = 'INFO'):
-        """Print formatted log message"""
-        timestamp = time.strftime('%H:%M:%S')
-        print(f'[{timestamp}] {level}: {message}')
+        """Log a message at the given level name"""
+        logger.log(logging.getLevelName(level), message)
 
     def get_admin_token(self) -> bool:
         """Get admin access token from master realm"""
         try:
-            url = f'{self.base_url}/realms/{self.master_realm}/protocol/openid-connect/token'
-            data = {
-                'username': self.admin_username,
-                'password': self.admin_password,
-                'grant_type': 'password',
-                'client_id': 'admin-cli',
-            }
-
-            response = requests.post(url, data=data, timeout=10)
+            response = self.session.post(
+                self.token_url,
+                data=self.admin_token_body,
+                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                timeout=10,
+            )
             response.raise_for_status()
 
             token_data = response.json()
             self.access_token = token_data['access_token']
+            # Every later admin call goes through the session with this token
+            self.session.headers['Authorization'] = f'Bearer {self.access_token}'
             self.log('✅ Admin token obtained successfully')
             return True
 
@@ -100,16 +123,14 @@ class DatabaseUserSyncer:
             """)
 
             users = []
-            for row in cursor.fetchall():
+            for user_id, email, first_name, last_name in cursor.fetchall():
                 users.append(
                     {
-                        'id': row[0],
-                        'email': row[1],
-                        'first_name': row[2],
-                        'last_name': row[3],
-                        'username': row[1].split('@')[
-                            0
-                        ],  # Use email prefix as username
+                        'id': user_id,
+                        'email': email,
+                        'first_name': first_name,
+                        'last_name': last_name,
+                        'username': email.partition('@')[0],  # Use email prefix
                         'password': self.default_password,  # Default password for all users
                     }
                 )
@@ -127,14 +148,15 @@ class DatabaseUserSyncer:
     def create_keycloak_user(self, user_data: dict) -> bool:
         """Create a user in Keycloak"""
         try:
-            headers = {'Authorization': f'Bearer {self.access_token}'}
-            users_url = f'{self.base_url}/admin/realms/{self.app_realm}/users'
-
-            # Check if user already exists
-            check_url = f'{users_url}?username={user_data["username"]}'
-            response = requests.get(check_url, headers=headers, timeout=10)
+            # Check if user already exists; only existence matters, so ask for
+            # at most one brief representation instead of full user documents
+            check_url = (
+                f'{self.users_url}?username={user_data["username"]}'
+                '&briefRepresentation=true&max=1'
+            )
+            response = self.session.get(check_url, timeout=10)
 
-            if response.status_code == 200 and len(response.json()) > 0:
+            if response.status_code == 200 and response.json():
                 self.log(
                     f"ℹ️  User '{user_data['username']}' already exists in Keycloak"
                 )
@@ -157,8 +179,8 @@ class DatabaseUserSyncer:
                 ],
             }
 
-            response = requests.post(
-                users_url, json=keycloak_user_data, headers=headers, timeout=10
+            response = self.session.post(
+                self.users_url, json=keycloak_user_data, timeout=10
             )
 
             if response.status_code == 201:
@@ -197,14 +219,19 @@ class DatabaseUserSyncer:
             return False
 
         # Step 3: Create users in Keycloak
+        # Users are independent, so overlap their admin API round-trips
         success_count = 0
-        for user_data in db_users:
-            if self.create_keycloak_user(user_data):
-                success_count += 1
-            else:
-                self.log(
-                    f'⚠️  Failed to sync user {user_data["username"]}, continuing...'
-                )
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {}
+            for user_data in db_users:
+                future = executor.submit(self.create_keycloak_user, user_data)
+                futures[future] = user_data['username']
+
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+                else:
+                    self.log(f'⚠️  Failed to sync user {futures[future]}, continuing...')
 
         self.log('=' * 50)
         self.log('🎉 User sync completed!')
@@ -217,8 +244,17 @@ class DatabaseUserSyncer:
 
 
 def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] %(levelname)s: %(message)s',
+        datefmt='%H:%M:%S',
+        stream=sys.stdout,
+    )
     syncer = DatabaseUserSyncer()
-    success = syncer.sync_users()
+    try:
+        success = syncer.sync_users()
+    finally:
+        syncer.session.close()
     exit(0 if success else 1)
 
 
@@ -6,20 +6,47 @@ import csv
 import os
 from datetime import UTC, datetime
 from decimal import Decimal
+from functools import lru_cache
 
-from sqlalchemy import delete, text
+from sqlalchemy import insert, text
 
 from db.database import SessionLocal
-from db.models import AlertNotification, AlertRule, CreditCard, Transaction, User
-
-
-async def parse_datetime(date_str: str) -> datetime:
+from db.models import Transaction, User
+
+# Read the sample CSVs in large chunks to cut down on read() calls
+CSV_READ_BUFFER_SIZE = 1 << 20
+
+# Column order of the records streamed into transactions with COPY
+TRANSACTION_COPY_COLUMNS = (
+    'id',
+    'user_id',
+    'credit_card_num',
+    'amount',
+    'currency',
+    'description',
+    'merchant_name',
+    'merchant_category',
+    'transaction_date',
+    'transaction_type',
+    'merchant_latitude',
+    'merchant_longitude',
+    'merchant_zipcode',
+    'merchant_city',
+    'merchant_state',
+    'merchant_country',
+    'status',
+    'authorization_code',
+    'trans_num',
+    'created_at',
+    'updated_at',
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(date_str: str) -> datetime:
     """Parse datetime string in ISO format"""
-    try:
-        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-    except ValueError:
-        # Fallback for different formats
-        return datetime.fromisoformat(date_str)
+    # fromisoformat accepts a trailing 'Z' natively on Python 3.11+
+    return datetime.fromisoformat(date_str)
 
 
 async def clear_existing_data(session) -> None:
@@ -27,106 +54,47 @@ async def clear_existing_data(session) -> None:
     print('🗑️  Clearing existing data from all tables...')
 
     try:
-        # Delete in order to respect foreign key constraints
-        # Child tables first, then parent tables
-
-        # Clear cached recommendations (has foreign keys to users)
-        print('   Clearing cached recommendations...')
-        result = await session.execute(text('DELETE FROM cached_recommendations'))
-        cached_recommendations_count = result.rowcount
-        print(f'   Deleted {cached_recommendations_count} cached recommendations')
-
-        # Clear alert notifications (has foreign keys to alert rules)
-        print('   Clearing alert notifications...')
-        result = await session.execute(delete(AlertNotification))
-        alert_notification_count = result.rowcount
-        print(f'   Deleted {alert_notification_count} alert notifications')
-
-        # Clear alert rules (has foreign keys to users)
-        print('   Clearing alert rules...')
-        result = await session.execute(delete(AlertRule))
-        alert_count = result.rowcount
-        print(f'   Deleted {alert_count} alert rules')
-
-        # Clear transactions first (has foreign keys to users)
-        print('   Clearing transactions...')
-        result = await session.execute(delete(Transaction))
-        transaction_count = result.rowcount
-        print(f'   Deleted {transaction_count} transactions')
-
-        # Clear credit cards (has foreign keys to users)
-        print('   Clearing credit cards...')
-        result = await session.execute(delete(CreditCard))
-        card_count = result.rowcount
-        print(f'   Deleted {card_count} credit cards')
-
-        # Clear users last (parent table)
-        print('   Clearing users...')
-        result = await session.execute(delete(User))
-        user_count = result.rowcount
-        print(f'   Deleted {user_count} users')
-
-        # Reset auto-increment sequences if using PostgreSQL
-        try:
-            # This will reset sequences for auto-increment columns
-            await session.execute(
-                text("SELECT setval(pg_get_serial_sequence('users', 'id'), 1, false);")
-            )
-            await session.execute(
-                text(
-                    "SELECT setval(pg_get_serial_sequence('transactions', 'id'), 1, false);"
-                )
-            )
-            await session.execute(
-                text(
-                    "SELECT setval(pg_get_serial_sequence('alert_rules', 'id'), 1, false);"
-                )
-            )
-            await session.execute(
-                text(
-                    "SELECT setval(pg_get_serial_sequence('credit_cards', 'id'), 1, false);"
-                )
-            )
-            print('   Reset auto-increment sequences')
-        except Exception as seq_error:
-            # Sequences may not exist or may have different names, which is okay
-            print(
-                f'   Note: Could not reset sequences (this is usually okay): {seq_error}'
+        # Truncate every loaded table in one statement: no per-row deletes or
+        # WAL, FK order is handled by CASCADE and sequences are reset
+        await session.execute(
+            text(
+                'TRUNCATE cached_recommendations, alert_notifications, alert_rules, '
+                'transactions, credit_cards, users RESTART IDENTITY CASCADE'
             )
-
+        )
         await session.commit()
 
-        total_deleted = transaction_count + alert_count + card_count + user_count
-        print(f'✅ Successfully cleared {total_deleted} total records from all tables')
-
+        print('✅ Successfully cleared all tables')
     except Exception as e:
         print(f'❌ Error clearing existing data: {e}')
         await session.rollback()
         raise
 
 
-async def load_users_from_csv(session, csv_path: str) -> dict[str, str]:
-    """Load users from CSV file and return mapping of old_id -> new_user_id"""
+async def load_users_from_csv(session, csv_path: str) -> set[str]:
+    """Load users from CSV file and return the set of loaded user IDs"""
     print(f'Loading users from {csv_path}')
 
     if not os.path.exists(csv_path):
         print(f'❌ CSV file not found: {csv_path}')
-        return {}
+        return set()
 
-    user_id_mapping = {}
+    user_ids = set()
 
     try:
         # First pass: Read all users to find the latest created_at date for time adjustment
         users_data = []
         latest_user_date = None
 
-        with open(csv_path, encoding='utf-8') as file:
+        with open(
+            csv_path, encoding='utf-8', newline='', buffering=CSV_READ_BUFFER_SIZE
+        ) as file:
             reader = csv.DictReader(file)
 
             for row in reader:
                 # Parse user creation date for time adjustment
                 if row.get('created_at'):
-                    created_at = await parse_datetime(row['created_at'])
+                    created_at = parse_datetime(row['created_at'])
                     if latest_user_date is None or created_at > latest_user_date:
                         latest_user_date = created_at
                     users_data.append((row, created_at))
@@ -135,7 +103,7 @@ async def load_users_from_csv(session, csv_path: str) -> dict[str, str]:
 
         if not users_data:
             print('No users found in CSV file')
-            return {}
+            return set()
 
         # Calculate time adjustment offset for users
         current_time = datetime.now(UTC)
@@ -147,7 +115,8 @@ async def load_users_from_csv(session, csv_path: str) -> dict[str, str]:
             user_time_offset = None
             print('⚠️  No user creation dates found, using current time')
 
-        # Second pass: Insert users with adjusted timestamps
+        # Second pass: Build user rows with adjusted timestamps
+        users_to_add = []
         users_added = 0
 
         for row, original_created_at in users_data:
@@ -161,7 +130,7 @@ async def load_users_from_csv(session, csv_path: str) -> dict[str, str]:
 
             # Adjust updated_at timestamp
             if row.get('updated_at'):
-                original_updated_at = await parse_datetime(row['updated_at'])
+                original_updated_at = parse_datetime(row['updated_at'])
                 if user_time_offset:
                     adjusted_updated_at = original_updated_at + user_time_offset
                 else:
@@ -169,47 +138,51 @@ async def load_users_from_csv(session, csv_path: str) -> dict[str, str]:
             else:
                 adjusted_updated_at = current_time
 
-            user = User(
-                id=row['id'],  # Use the ID from CSV
-                email=row['email'],
-                keycloak_id=row.get('keycloak_id'),
-                first_name=row['first_name'],
-                last_name=row['last_name'],
-                phone_number=row.get('phone_number'),
-                address_street=row.get('address_street'),
-                address_city=row.get('address_city'),
-                address_state=row.get('address_state'),
-                address_zipcode=row.get('address_zipcode'),
-                address_country=row.get('address_country'),
-                credit_limit=Decimal(row.get('credit_limit', '0'))
-                if row.get('credit_limit')
-                else None,
-                credit_balance=Decimal(row.get('credit_balance', '0'))
-                if row.get('credit_balance')
-                else None,
-                is_active=row.get('is_active', 'True').lower() == 'true',
-                created_at=adjusted_created_at,
-                updated_at=adjusted_updated_at,
+            users_to_add.append(
+                {
+                    'id': row['id'],  # Use the ID from CSV
+                    'email': row['email'],
+                    'keycloak_id': row.get('keycloak_id'),
+                    'first_name': row['first_name'],
+                    'last_name': row['last_name'],
+                    'phone_number': row.get('phone_number'),
+                    'address_street': row.get('address_street'),
+                    'address_city': row.get('address_city'),
+                    'address_state': row.get('address_state'),
+                    'address_zipcode': row.get('address_zipcode'),
+                    # An explicit NULL would bypass the server defaults, and
+                    # executemany needs the same keys in every row, so the
+                    # defaults are filled in here instead
+                    'address_country': row.get('address_country') or 'US',
+                    'credit_limit': Decimal(row.get('credit_limit', '0'))
+                    if row.get('credit_limit')
+                    else None,
+                    'credit_balance': Decimal(row['credit_balance'])
+                    if row.get('credit_balance')
+                    else Decimal('0.00'),
+                    'is_active': row.get('is_active', 'True').lower() == 'true',
+                    'created_at': adjusted_created_at,
+                    'updated_at': adjusted_updated_at,
+                }
             )
-
-            session.add(user)
-            user_id_mapping[row['id']] = row['id']
+            user_ids.add(row['id'])
             users_added += 1
 
+        await session.execute(insert(User), users_to_add)
         await session.commit()
         print(
             f'✅ Successfully loaded {users_added} users from CSV with adjusted timestamps'
         )
-        return user_id_mapping
+        return user_ids
 
     except Exception as e:
         print(f'❌ Error loading users from CSV: {e}')
         await session.rollback()
-        return {}
+        return set()
 
 
 async def load_transactions_from_csv(
-    session, csv_path: str, user_id_mapping: dict[str, str]
+    session, csv_path: str, user_ids: set[str]
 ) -> None:
     """Load transactions from CSV file with adjusted timestamps"""
     print(f'Loading transactions from {csv_path}')
@@ -224,21 +197,37 @@ async def load_transactions_from_csv(
         transactions_data = []
         latest_transaction_date = None
 
-        with open(csv_path, encoding='utf-8') as file:
-            reader = csv.DictReader(file)
+        with open(
+            csv_path, encoding='utf-8', newline='', buffering=CSV_READ_BUFFER_SIZE
+        ) as file:
+            reader = csv.reader(file)
+
+            # Map column names to positions once instead of a dict per row.
+            # Optional columns missing from the header read the trailing None
+            # cell appended to every row, like DictReader's row.get
+            header = next(reader, [])
+            width = len(header)
+            column = {name: i for i, name in enumerate(header)}
+            user_id_i = column['user_id']
+            transaction_date_i = column.get('transaction_date', width)
 
             for row in reader:
-                # Map user_id from CSV to actual user_id
-                user_id = user_id_mapping.get(row['user_id'])
-                if not user_id:
+                if len(row) != width:
+                    # Short rows read None for their missing cells
+                    row = (row + [None] * width)[:width]
+                row.append(None)
+
+                # CSV user IDs are loaded as-is, so only check membership
+                user_id = row[user_id_i]
+                if user_id not in user_ids:
                     print(
-                        f'Warning: User ID {row["user_id"]} not found in user mapping, skipping transaction'
+                        f'Warning: User ID {user_id} not found in loaded users, skipping transaction'
                     )
                     continue
 
                 # Parse transaction date
-                if row.get('transaction_date'):
-                    transaction_date = await parse_datetime(row['transaction_date'])
+                if row[transaction_date_i]:
+                    transaction_date = parse_datetime(row[transaction_date_i])
                     if (
                         latest_transaction_date is None
                         or transaction_date > latest_transaction_date
@@ -268,8 +257,33 @@ async def load_transactions_from_csv(
                 '⚠️  No transaction dates found, using current time for all transactions'
             )
 
-        # Second pass: Insert transactions with adjusted timestamps
-        transactions_added = 0
+        # Second pass: Build COPY records with adjusted timestamps
+        records = []
+
+        id_i = column['id']
+        credit_card_num_i = column.get('credit_card_num', width)
+        amount_i = column.get('amount', width)
+        currency_i = column.get('currency', width)
+        description_i = column.get('description', width)
+        merchant_name_i = column.get('merchant_name', width)
+        merchant_category_i = column.get('merchant_category', width)
+        transaction_type_i = column.get('transaction_type', width)
+        merchant_latitude_i = column.get('merchant_latitude', width)
+        merchant_longitude_i = column.get('merchant_longitude', width)
+        merchant_zipcode_i = column.get('merchant_zipcode', width)
+        merchant_city_i = column.get('merchant_city', width)
+        merchant_state_i = column.get('merchant_state', width)
+        merchant_country_i = column.get('merchant_country', width)
+        status_i = column.get('status', width)
+        authorization_code_i = column.get('authorization_code', width)
+        trans_num_i = column.get('trans_num', width)
+        created_at_i = column.get('created_at', width)
+        updated_at_i = column.get('updated_at', width)
+
+        # Bind hot-loop callables to locals to skip global/attribute lookups
+        parse = parse_datetime
+        append = records.append
+        to_float = float
 
         for row, user_id, original_date in transactions_data:
             # Adjust transaction date
@@ -281,8 +295,8 @@ async def load_transactions_from_csv(
                 adjusted_transaction_date = current_time
 
             # Adjust created_at and updated_at times as well
-            if row.get('created_at'):
-                original_created_at = await parse_datetime(row['created_at'])
+            if row[created_at_i]:
+                original_created_at = parse(row[created_at_i])
                 if time_offset:
                     adjusted_created_at = original_created_at + time_offset
                 else:
@@ -290,8 +304,8 @@ async def load_transactions_from_csv(
             else:
                 adjusted_created_at = current_time
 
-            if row.get('updated_at'):
-                original_updated_at = await parse_datetime(row['updated_at'])
+            if row[updated_at_i]:
+                original_updated_at = parse(row[updated_at_i])
                 if time_offset:
                     adjusted_updated_at = original_updated_at + time_offset
                 else:
@@ -299,40 +313,53 @@ async def load_transactions_from_csv(
             else:
                 adjusted_updated_at = current_time
 
-            transaction = Transaction(
-                id=row['id'],
-                user_id=user_id,
-                credit_card_num=row.get('credit_card_num'),
-                amount=Decimal(row['amount']) if row.get('amount') else Decimal('0'),
-                currency=row.get('currency', 'USD'),
-                description=row.get('description'),
-                merchant_name=row.get('merchant_name'),
-                merchant_category=row.get('merchant_category'),
-                transaction_date=adjusted_transaction_date,
-                transaction_type=row.get('transaction_type'),
-                merchant_latitude=float(row['merchant_latitude'])
-                if row.get('merchant_latitude')
-                else None,
-                merchant_longitude=float(row['merchant_longitude'])
-                if row.get('merchant_longitude')
-                else None,
-                merchant_zipcode=row.get('merchant_zipcode'),
-                merchant_city=row.get('merchant_city'),
-                merchant_state=row.get('merchant_state'),
-                merchant_country=row.get('merchant_country'),
-                status=row.get('status'),
-                authorization_code=row.get('authorization_code'),
-                trans_num=row.get('trans_num'),
-                created_at=adjusted_created_at,
-                updated_at=adjusted_updated_at,
+            append(
+                (
+                    row[id_i],
+                    user_id,
+                    row[credit_card_num_i],
+                    # asyncpg's numeric codec parses the string itself
+                    row[amount_i] or '0',
+                    # COPY skips server defaults, so fill them in here
+                    row[currency_i] or 'USD',
+                    row[description_i],
+                    row[merchant_name_i],
+                    row[merchant_category_i],
+                    adjusted_transaction_date,
+                    row[transaction_type_i] or 'PURCHASE',
+                    to_float(row[merchant_latitude_i])
+                    if row[merchant_latitude_i]
+                    else None,
+                    to_float(row[merchant_longitude_i])
+                    if row[merchant_longitude_i]
+                    else None,
+                    row[merchant_zipcode_i],
+                    row[merchant_city_i],
+                    row[merchant_state_i],
+                    row[merchant_country_i],
+                    row[status_i] or 'PENDING',
+                    row[authorization_code_i],
+                    row[trans_num_i],
+                    adjusted_created_at,
+                    adjusted_updated_at,
+                )
             )
 
-            session.add(transaction)
-            transactions_added += 1
-
+        # The sample load is re-runnable, so skip waiting on the WAL flush
+        # at commit; this also opens the transaction the COPY runs in
+        await session.execute(text('SET LOCAL synchronous_commit = OFF'))
+
+        # Stream the rows with COPY on the underlying asyncpg connection
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Transaction.__tablename__,
+            records=records,
+            columns=TRANSACTION_COPY_COLUMNS,
+        )
         await session.commit()
         print(
-            f'✅ Successfully loaded {transactions_added} transactions from CSV with adjusted timestamps'
+            f'✅ Successfully loaded {len(records)} transactions from CSV with adjusted timestamps'
         )
 
         # Show some example adjusted dates for verification
@@ -362,17 +389,15 @@ async def load_csv_data(
             # Clear all existing data first
             await clear_existing_data(session)
 
-            # Load users first and get ID mapping
-            user_id_mapping = await load_users_from_csv(session, users_csv_path)
+            # Load users first and get the loaded user IDs
+            user_ids = await load_users_from_csv(session, users_csv_path)
 
-            if not user_id_mapping:
+            if not user_ids:
                 print('❌ No users loaded, skipping transactions')
                 return
 
-            # Load transactions using the user ID mapping
-            await load_transactions_from_csv(
-                session, transactions_csv_path, user_id_mapping
-            )
+            # Load transactions for the loaded users
+            await load_transactions_from_csv(session, transactions_csv_path, user_ids)
 
             print('✅ CSV data loading completed successfully!')
 
@@ -82,7 +82,7 @@ def create_keycloak_user(
             return True
 
         # Extract username from email
-        username = email.split('@')[0]
+        username = email.partition('@')[0]
 
         # Create new user
         user_data = {
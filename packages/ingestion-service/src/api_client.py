@@ -0,0 +1,127 @@
+"""
+Client for the API service
+"""
+
+import datetime
+import os
+import time
+
+import httpx
+import orjson
+
+
+class APIClient:
+    """Client for posting transactions to the API service"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
+        self.api_host = os.environ.get('API_HOST', 'localhost')
+        self.api_port = os.environ.get('API_PORT', '8000')
+        self.api_base_url = f'http://{self.api_host}:{self.api_port}'
+        self.timeout = httpx.Timeout(30.0, connect=5.0)
+        # Keep connections to the API warm so bursts of transactions reuse
+        # sockets instead of paying a TCP handshake per request
+        self.limits = httpx.Limits(
+            max_connections=int(os.environ.get('API_MAX_CONNECTIONS', '100')),
+            max_keepalive_connections=int(
+                os.environ.get('API_MAX_KEEPALIVE_CONNECTIONS', '20')
+            ),
+            keepalive_expiry=30.0,
+        )
+        # The API requires a bearer token unless it runs with BYPASS_AUTH. Use
+        # a token with the admin role, otherwise the API imports every
+        # transaction as the token's own user
+        self.headers: dict[str, str] = {}
+        api_auth_token = os.environ.get('API_AUTH_TOKEN')
+        if api_auth_token:
+            self.headers['Authorization'] = f'Bearer {api_auth_token}'
+        self.transport = transport
+        self._client: httpx.AsyncClient | None = None
+        # Probes hit /health repeatedly; reuse the last API check for a while
+        self.health_cache_ttl = float(os.environ.get('API_HEALTH_CACHE_TTL', '10'))
+        self._health_cache: tuple[float, dict] | None = None
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.api_base_url,
+                timeout=self.timeout,
+                limits=self.limits,
+                headers=self.headers,
+                transport=self.transport,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def post_transaction(self, transaction_data: dict) -> bool:
+        """Post transaction to API service"""
+        try:
+            # orjson serializes straight to bytes, skipping json.dumps + encode
+            response = await self.get_client().post(
+                '/api/transactions',
+                content=orjson.dumps(transaction_data),
+                headers={'Content-Type': 'application/json'},
+            )
+            response.raise_for_status()
+            print(f'Successfully posted transaction to API: {response.status_code}')
+            return True
+        except Exception as e:
+            print(f'Failed to post transaction to API: {e}')
+            return False
+
+    async def post_transactions_batch(self, transactions_data: list[dict]) -> dict:
+        """
+        Post a batch of transactions to the API import endpoint in one request.
+
+        Returns the API's import result and raises httpx.HTTPError if the
+        request fails, so callers can report it.
+        """
+        payload = {
+            'transactions': transactions_data,
+            'source': 'ingestion-service',
+            'importDate': datetime.datetime.now(datetime.UTC).isoformat(),
+        }
+        response = await self.get_client().post(
+            '/api/transactions/import',
+            content=orjson.dumps(payload),
+            headers={'Content-Type': 'application/json'},
+        )
+        response.raise_for_status()
+        print(
+            f'Successfully posted {len(transactions_data)} transactions to API: '
+            f'{response.status_code}'
+        )
+        return orjson.loads(response.content)
+
+    async def health_check(self) -> dict:
+        """Check API connectivity, reusing a recent result if one is cached"""
+        now = time.monotonic()
+        if self._health_cache and now - self._health_cache[0] < self.health_cache_ttl:
+            return self._health_cache[1]
+
+        try:
+            response = await self.get_client().get('/health/', timeout=5.0)
+            response.raise_for_status()
+            result = {
+                'api_status': 'healthy',
+                'api_reachable': True,
+                'response_code': response.status_code,
+            }
+        except Exception as e:
+            result = {
+                'api_status': 'unhealthy',
+                'api_reachable': False,
+                'error': str(e),
+            }
+
+        self._health_cache = (now, result)
+        return result
+
+
+# Global API client
+api_client = APIClient()
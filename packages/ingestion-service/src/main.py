@@ -3,74 +3,38 @@ Ingestion Service
 """
 
 import datetime
-import os
+import logging
 import uuid
 from contextlib import asynccontextmanager
 
 import httpx
-from fastapi import FastAPI
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 
+from .api_client import api_client
 from .common.models import IncomingTransaction, Transaction
+from .parsing import parse_time
 
-
-class APIClient:
-    """Client for posting transactions to the API service"""
-
-    def __init__(self):
-        self.api_host = os.environ.get('API_HOST', 'localhost')
-        self.api_port = os.environ.get('API_PORT', '8000')
-        self.api_base_url = f'http://{self.api_host}:{self.api_port}'
-        self.timeout = 30.0
-
-    async def post_transaction(self, transaction_data: dict) -> bool:
-        """Post transaction to API service"""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f'{self.api_base_url}/transactions', json=transaction_data
-                )
-                response.raise_for_status()
-                print(f'Successfully posted transaction to API: {response.status_code}')
-                return True
-        except Exception as e:
-            print(f'Failed to post transaction to API: {e}')
-            return False
-
-    async def health_check(self) -> dict:
-        """Check API connectivity"""
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f'{self.api_base_url}/health/')
-                response.raise_for_status()
-                return {
-                    'api_status': 'healthy',
-                    'api_reachable': True,
-                    'response_code': response.status_code,
-                }
-        except Exception as e:
-            return {'api_status': 'unhealthy', 'api_reachable': False, 'error': str(e)}
-
-
-# Global API client
-api_client = APIClient()
+logger = logging.getLogger(__name__)
 
 
 def transform_transaction(incoming_transaction: IncomingTransaction) -> Transaction:
     """Transform incoming transaction to internal format"""
-    amount = float(incoming_transaction.Amount.replace('$', ''))
+    raw_amount = incoming_transaction.Amount
+    amount = float(raw_amount[1:] if raw_amount.startswith('$') else raw_amount)
     is_fraud = incoming_transaction.is_fraud == 'Yes'
 
-    # split time string into hours and minutes
-    time_parts = incoming_transaction.Time.split(':')
-    hour, minute = int(time_parts[0]), int(time_parts[1])
+    txn_time = parse_time(incoming_transaction.Time)
 
-    return Transaction(
+    # Every field comes from an already validated IncomingTransaction or is
+    # computed above, so skip running validation a second time
+    return Transaction.model_construct(
         user=incoming_transaction.User,
         card=incoming_transaction.Card,
         year=incoming_transaction.Year,
         month=incoming_transaction.Month,
         day=incoming_transaction.Day,
-        time=datetime.time(hour, minute),
+        time=txn_time,
         amount=amount,
         use_chip=incoming_transaction.use_chip,
         merchant_id=incoming_transaction.merchant_name,
@@ -85,14 +49,19 @@ def transform_transaction(incoming_transaction: IncomingTransaction) -> Transact
 
 def transform_to_api_format(transaction: Transaction) -> dict:
     """Transform transaction to API TransactionCreate format"""
-    # Create transaction date from year, month, day, time
-    transaction_date = datetime.datetime.combine(
-        datetime.date(transaction.year, transaction.month, transaction.day),
-        transaction.time,
+    # Build the transaction date in one constructor call instead of
+    # creating an intermediate date and combining it with the time
+    txn_time = transaction.time
+    transaction_date = datetime.datetime(
+        transaction.year,
+        transaction.month,
+        transaction.day,
+        txn_time.hour,
+        txn_time.minute,
     )
 
     return {
-        'id': str(uuid.uuid4()),
+        'id': uuid.uuid4().hex,
         'user_id': str(transaction.user),
         'credit_card_num': str(transaction.card),
         'amount': transaction.amount,
@@ -117,28 +86,61 @@ async def lifespan(app: FastAPI):
     print('Ingestion service starting up...')
     yield
     print('Ingestion service shutting down...')
+    await api_client.close()
+
+
+# Render every response with orjson instead of the stdlib json encoder
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
 
+async def forward_transaction(api_transaction_data: dict) -> None:
+    """Post a transformed transaction to the API service"""
+    api_success = await api_client.post_transaction(api_transaction_data)
 
-app = FastAPI(lifespan=lifespan)
+    if not api_success:
+        print('Warning: Transaction processed but not sent to API service')
 
 
 @app.post('/transactions/')
-async def create_transaction(incoming_transaction: IncomingTransaction):
+async def create_transaction(
+    incoming_transaction: IncomingTransaction, background_tasks: BackgroundTasks
+):
     """Create and process a transaction"""
     transaction = transform_transaction(incoming_transaction)
-    print(f'Received transaction: {transaction.model_dump()}')
+    logger.debug(
+        'Received transaction user=%s amount=%s merchant=%s',
+        transaction.user,
+        transaction.amount,
+        transaction.merchant_id,
+    )
 
-    # Transform to API format and post to API service
+    # Transform to API format and post to API service after responding; the
+    # response never depended on the API call succeeding
     api_transaction_data = transform_to_api_format(transaction)
-    api_success = await api_client.post_transaction(api_transaction_data)
-
-    if not api_success:
-        print('Warning: Transaction processed but not sent to API service')
-        # Still return the transaction even if API posting fails
+    background_tasks.add_task(forward_transaction, api_transaction_data)
 
     return transaction
 
 
+@app.post('/transactions/batch')
+async def create_transactions_batch(incoming_transactions: list[IncomingTransaction]):
+    """Create and process a batch of transactions with a single API import"""
+    transactions = [transform_transaction(t) for t in incoming_transactions]
+    logger.debug('Received batch of %d transactions', len(transactions))
+
+    # Import before responding so the caller learns when nothing was imported
+    api_transactions_data = [transform_to_api_format(t) for t in transactions]
+    try:
+        import_result = await api_client.post_transactions_batch(api_transactions_data)
+    except httpx.HTTPError as e:
+        logger.error('Failed to import transaction batch into the API: %s', e)
+        raise HTTPException(
+            status_code=502, detail=f'Failed to import transactions into the API: {e}'
+        ) from e
+
+    return {'transactions': transactions, 'import_result': import_result}
+
+
 @app.get('/healthz')
 async def healthz():
     """Simple health check endpoint"""
@@ -154,7 +156,7 @@ async def health():
     return {
         'status': overall_status,
         'service': 'ingestion-service',
-        'timestamp': datetime.now(UTC).isoformat(),
+        'timestamp': datetime.datetime.now(datetime.UTC).isoformat(),
         'api': api_health,
         'environment': {
             'api_host': api_client.api_host,
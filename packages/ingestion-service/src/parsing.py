@@ -0,0 +1,14 @@
+"""
+Parsing helpers for incoming transaction fields
+"""
+
+import datetime
+
+
+def parse_time(value: str) -> datetime.time:
+    """Parse an H:MM or HH:MM[:SS] time string, ignoring any seconds"""
+    # Split by hand rather than time.fromisoformat, which rejects an hour
+    # without a leading zero such as '9:05'
+    hour, _, rest = value.partition(':')
+    minute = rest.partition(':')[0]
+    return datetime.time(int(hour), int(minute))
@@ -0,0 +1,75 @@
+"""Test cases for the API service client"""
+
+import httpx
+import orjson
+import pytest
+
+from src.api_client import APIClient
+
+IMPORT_RESULT = {'totalProcessed': 1, 'successful': 1, 'failed': 0, 'errors': []}
+
+
+def _client(handler) -> APIClient:
+    return APIClient(transport=httpx.MockTransport(handler))
+
+
+class TestAPIClient:
+    """Test suite for APIClient"""
+
+    @pytest.mark.asyncio
+    async def test_batch_posts_to_import_endpoint_with_token(self, monkeypatch):
+        """Test a batch goes to the API import route with the bearer token"""
+        monkeypatch.setenv('API_AUTH_TOKEN', 'secret')
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=IMPORT_RESULT)
+
+        client = _client(handler)
+        result = await client.post_transactions_batch([{'id': 'tx-1'}])
+        await client.close()
+
+        assert result == IMPORT_RESULT
+        [request] = requests
+        assert request.method == 'POST'
+        assert request.url.path == '/api/transactions/import'
+        assert request.headers['Authorization'] == 'Bearer secret'
+        payload = orjson.loads(request.content)
+        assert payload['transactions'] == [{'id': 'tx-1'}]
+        assert payload['source'] == 'ingestion-service'
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_raises(self):
+        """Test a rejected batch raises instead of being reported as sent"""
+        client = _client(lambda request: httpx.Response(401))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.post_transactions_batch([{'id': 'tx-1'}])
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_single_transaction_posts_to_transactions_route(self, monkeypatch):
+        """Test a single transaction goes to the API create route"""
+        monkeypatch.delenv('API_AUTH_TOKEN', raising=False)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={'id': 'tx-1'})
+
+        client = _client(handler)
+        assert await client.post_transaction({'id': 'tx-1'}) is True
+        await client.close()
+
+        [request] = requests
+        assert request.url.path == '/api/transactions'
+        assert 'Authorization' not in request.headers
+
+    @pytest.mark.asyncio
+    async def test_single_transaction_failure_returns_false(self):
+        """Test a rejected single transaction is reported as not sent"""
+        client = _client(lambda request: httpx.Response(500))
+
+        assert await client.post_transaction({'id': 'tx-1'}) is False
+        await client.close()
@@ -0,0 +1,29 @@
+"""Test cases for incoming transaction field parsing"""
+
+import datetime
+
+import pytest
+
+from src.parsing import parse_time
+
+
+class TestParseTime:
+    """Test suite for parse_time"""
+
+    @pytest.mark.parametrize(
+        ('value', 'expected'),
+        [
+            ('09:05', datetime.time(9, 5)),
+            ('9:05', datetime.time(9, 5)),
+            ('23:59', datetime.time(23, 59)),
+            ('14:30:45', datetime.time(14, 30)),
+        ],
+    )
+    def test_parses_hour_and_minute(self, value, expected):
+        """Test zero-padded and unpadded hours parse, dropping seconds"""
+        assert parse_time(value) == expected
+
+    def test_rejects_malformed_time(self):
+        """Test a value without a minute part is rejected"""
+        with pytest.raises(ValueError):
+            parse_time('9')
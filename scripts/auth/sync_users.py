@@ -177,16 +177,16 @@ class KeycloakUserSync:
         if not self.get_admin_token():
             return {"status": "error", "message": "Failed to get admin token"}
 
-        # Get Keycloak users
-        keycloak_users = self.get_keycloak_users()
-        if not keycloak_users:
-            return {"status": "error", "message": "No users found in Keycloak"}
-
         # Get database session
         async with SessionLocal() as session:
             try:
-                # Get existing database users
-                db_users = await self.get_database_users(session)
+                # Fetch Keycloak and existing database users concurrently
+                keycloak_users, db_users = await asyncio.gather(
+                    asyncio.to_thread(self.get_keycloak_users),
+                    self.get_database_users(session),
+                )
+                if not keycloak_users:
+                    return {"status": "error", "message": "No users found in Keycloak"}
 
                 self.log(
                     f"📊 Found {len(keycloak_users)} Keycloak users and {len(db_users)} database users"
@@ -230,12 +230,12 @@ class KeycloakUserSync:
         if not self.get_admin_token():
             return {"status": "error", "message": "Failed to get admin token"}
 
-        # Get Keycloak users
-        keycloak_users = self.get_keycloak_users()
-
-        # Get database users
+        # Fetch Keycloak and database users concurrently
         async with SessionLocal() as session:
-            db_users = await self.get_database_users(session)
+            keycloak_users, db_users = await asyncio.gather(
+                asyncio.to_thread(self.get_keycloak_users),
+                self.get_database_users(session),
+            )
 
         # Create comparison
         kc_emails = {user.get("email") for user in keycloak_users if user.get("email")}
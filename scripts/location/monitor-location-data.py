@@ -20,20 +20,23 @@ def clear_screen():
 def monitor_user_location(user_id: str, interval: int = 2):
     """Monitor user location data in real-time"""
     
-    print("🔄 REAL-TIME LOCATION MONITOR")
-    print("=" * 80)
-    print("🌐 Frontend: http://localhost:3000")
-    print("🚀 Backend:  http://localhost:8002")
-    print(f"👤 User ID:  {user_id}")
-    print("=" * 80)
-    print("💡 Instructions:")
-    print("   1. Open frontend in browser")
-    print("   2. Look for location consent dialog")  
-    print("   3. Grant location permission")
-    print("   4. Watch this monitor for updates!")
-    print("=" * 80)
-    print("⏱️  Monitoring every {} seconds... (Ctrl+C to stop)".format(interval))
-    print()
+    # Emit the banner in a single write instead of one per line
+    print("\n".join([
+        "🔄 REAL-TIME LOCATION MONITOR",
+        "=" * 80,
+        "🌐 Frontend: http://localhost:3000",
+        "🚀 Backend:  http://localhost:8002",
+        f"👤 User ID:  {user_id}",
+        "=" * 80,
+        "💡 Instructions:",
+        "   1. Open frontend in browser",
+        "   2. Look for location consent dialog",
+        "   3. Grant location permission",
+        "   4. Watch this monitor for updates!",
+        "=" * 80,
+        "⏱️  Monitoring every {} seconds... (Ctrl+C to stop)".format(interval),
+        "",
+    ]))
     
     last_location = None
     last_consent = None
@@ -127,10 +130,12 @@ def monitor_user_location(user_id: str, interval: int = 2):
             response = requests.get(f"{API_BASE_URL}/users/{user_id}")
             if response.status_code == 200:
                 final_data = response.json()
-                print("\n📊 FINAL LOCATION STATE:")
-                print(f"   Consent: {final_data.get('location_consent_given')}")
-                print(f"   Location: {final_data.get('last_app_location_latitude')}, {final_data.get('last_app_location_longitude')}")
-                print(f"   Timestamp: {final_data.get('last_app_location_timestamp')}")
+                print("\n".join([
+                    "\n📊 FINAL LOCATION STATE:",
+                    f"   Consent: {final_data.get('location_consent_given')}",
+                    f"   Location: {final_data.get('last_app_location_latitude')}, {final_data.get('last_app_location_longitude')}",
+                    f"   Timestamp: {final_data.get('last_app_location_timestamp')}",
+                ]))
         except:
             pass
 